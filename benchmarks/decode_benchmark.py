@@ -0,0 +1,72 @@
+"""Measures decoding the token labels of classified offers to structured data in offers per second.
+
+Compares process_labels on the entity dicts of the transformers pipeline with
+process_token_labels on the token label arrays. The model runs once up front,
+so only the decoding is measured.
+
+Usage:
+    python -m benchmarks.decode_benchmark [checkpoint]
+"""
+import itertools
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from loguru import logger
+
+from config import RAW_SPECIFICATIONS_DIR
+from spec_extraction.process import iter_raw_product_files
+from token_classification.backends import TokenClassifier
+from token_classification.utilities import TokenLabels
+from token_classification.utilities import get_best_checkpoint
+from token_classification.utilities import process_labels
+from token_classification.utilities import process_token_labels
+from token_classification.utilities import specs_to_text
+
+OFFERS = 500
+BATCH_SIZE = 16
+
+
+def torch_token_classifier(checkpoint: Path) -> TokenClassifier:
+    import torch
+    import transformers
+
+    model = transformers.AutoModelForTokenClassification.from_pretrained(checkpoint)
+    model.eval()
+
+    def logits(encoding):
+        with torch.no_grad():
+            return model(**{name: torch.from_numpy(values) for name, values in encoding.items()}).logits.numpy()
+
+    tokenizer = transformers.AutoTokenizer.from_pretrained(checkpoint)
+    return TokenClassifier(logits, tokenizer, model.config.id2label)
+
+
+def measure(decode: Callable[[TokenLabels], dict], token_labels: list[TokenLabels]) -> tuple[float, list[dict]]:
+    """Returns the offers per second and the structured data."""
+    start = time.perf_counter()
+    structured = [decode(labels) for labels in token_labels]
+    return len(token_labels) / (time.perf_counter() - start), structured
+
+
+def main():
+    logger.remove()  # measure decoding, not logging
+    checkpoint = Path(sys.argv[1]) if len(sys.argv) > 1 else get_best_checkpoint()
+    raw_products = itertools.islice(iter_raw_product_files(RAW_SPECIFICATIONS_DIR), OFFERS)
+    texts = [specs_to_text(raw_product.raw_specifications) for raw_product in raw_products]
+    classifier = torch_token_classifier(checkpoint)
+    token_labels = []
+    for start in range(0, len(texts), BATCH_SIZE):
+        token_labels.extend(classifier.classify_token_labels(texts[start : start + BATCH_SIZE]))
+    print(f"Decoding {len(texts)} offers, {sum(map(len, token_labels))} labeled tokens, with {checkpoint}")
+
+    entities, entities_result = measure(lambda labels: process_labels(labels.to_entities()), token_labels)
+    arrays, arrays_result = measure(process_token_labels, token_labels)
+    agreement = sum(a == b for a, b in zip(entities_result, arrays_result)) / len(texts)
+    print(f"  Entity dicts:       {entities:10.1f} offers/s")
+    print(f"  Token label arrays: {arrays:10.1f} offers/s ({arrays / entities:.1f}x), {agreement:.1%} agreement")
+
+
+if __name__ == "__main__":
+    main()
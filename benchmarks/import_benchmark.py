@@ -0,0 +1,40 @@
+"""Measures the startup of the pipeline entry points with python -X importtime.
+
+Prints the cumulative import time of each entry point and its slowest dependencies.
+
+Usage:
+    python -m benchmarks.import_benchmark
+"""
+
+import subprocess
+import sys
+
+ENTRY_POINTS = ["spec_extraction.cli", "spec_extraction.bootstrap", "spec_extraction.evaluation.evaluate"]
+SLOWEST = 5
+
+
+def import_times(module: str) -> dict[str, float]:
+    """Returns the cumulative import time in seconds per module imported by a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, microseconds, name = line.split("|")
+        cumulative[name.strip()] = int(microseconds) / 1e6
+    return cumulative
+
+
+def main():
+    for module in ENTRY_POINTS:
+        times = import_times(module)
+        print(f"{module}: {times[module]:.2f}s")
+        top_level = {name: seconds for name, seconds in times.items() if "." not in name and name != module}
+        for name, seconds in sorted(top_level.items(), key=lambda item: -item[1])[:SLOWEST]:
+            print(f"  {name:30} {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measures latency and throughput of the token classification backends on CPU.
+
+Latency is the median time to classify a single offer, throughput the offers
+per second in batches. Agreement is the share of offers for which
+process_labels returns the same result as the torch backend.
+
+Usage:
+    python -m benchmarks.inference_benchmark [checkpoint]
+"""
+import itertools
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from config import RAW_SPECIFICATIONS_DIR
+from spec_extraction.process import iter_raw_product_files
+from token_classification import backends
+from token_classification.utilities import get_best_checkpoint
+from token_classification.utilities import process_labels
+from token_classification.utilities import specs_to_text
+
+OFFERS = 200
+BATCH_SIZE = 16
+
+
+def measure(classifier, texts: list[str]) -> tuple[float, float, list[dict]]:
+    """Returns the median latency in seconds, the throughput in offers per second and the labels."""
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        classifier(text)
+        latencies.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    labeled = classifier(texts, batch_size=BATCH_SIZE)
+    throughput = len(texts) / (time.perf_counter() - start)
+    return statistics.median(latencies), throughput, [process_labels(entities) for entities in labeled]
+
+
+def main():
+    logger.remove()  # process_labels logs conflicting values
+    checkpoint = Path(sys.argv[1]) if len(sys.argv) > 1 else get_best_checkpoint()
+    raw_products = itertools.islice(iter_raw_product_files(RAW_SPECIFICATIONS_DIR), OFFERS)
+    texts = [specs_to_text(raw_product.raw_specifications) for raw_product in raw_products]
+    print(f"Classifying {len(texts)} offers with {checkpoint}")
+
+    reference = None
+    for backend in backends.BACKENDS:
+        if backend == "onnx" and backends.onnxruntime is None:
+            print(f"  {backend:10} skipped, onnxruntime is not installed")
+            continue
+        latency, throughput, labels = measure(backends.load_backend(backend, checkpoint), texts)
+        if reference is None:
+            reference = labels
+        agreement = sum(a == b for a, b in zip(labels, reference)) / len(texts)
+        print(
+            f"  {backend:10} {latency * 1000:8.1f} ms/offer {throughput:8.1f} offers/s "
+            f"{agreement:6.1%} agreement with torch"
+        )
+
+
+if __name__ == "__main__":
+    main()
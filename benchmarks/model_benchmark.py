@@ -0,0 +1,60 @@
+"""Measures loading and saving of raw specifications in files per second.
+
+Compares the marshmallow schemas against the trusted fast path and compact JSON.
+
+Usage:
+    python -m benchmarks.model_benchmark
+"""
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from config import RAW_SPECIFICATIONS_DIR
+from spec_extraction.model import RawProduct
+
+FILES = 2000
+
+
+def load_with_schema(file: Path) -> RawProduct:
+    """Previous behaviour, validates every file with the schema."""
+    with open(file, "r") as f:
+        return RawProduct.Schema().load(json.load(f))
+
+
+def save_with_schema(raw_product: RawProduct, file: Path):
+    """Previous behaviour, dumps with the schema."""
+    file.write_text(json.dumps(RawProduct.Schema().dump(raw_product.__dict__), indent=4, sort_keys=True))
+
+
+def measure(func, items: list) -> float:
+    """Returns the items per second."""
+    start = time.perf_counter()
+    for item in items:
+        func(*item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def main():
+    files = sorted(RAW_SPECIFICATIONS_DIR.glob("offer_*_specification.json"))[:FILES]
+    raw_products = [RawProduct.load_from_json(file) for file in files]
+
+    print(f"Loading {len(files)} files")
+    schema = measure(load_with_schema, [(file,) for file in files])
+    trusted = measure(lambda file: RawProduct.load_from_json(file, trusted=True), [(file,) for file in files])
+    print(f"Schema:         {schema:10.1f} files/s")
+    print(f"Trusted:        {trusted:10.1f} files/s ({trusted / schema:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        items = [(raw_product, Path(tmp_dir) / raw_product.filename) for raw_product in raw_products]
+        print(f"Saving {len(items)} files")
+        schema = measure(save_with_schema, items)
+        pretty = measure(lambda raw_product, file: raw_product.save_to_json(file), items)
+        compact = measure(lambda raw_product, file: raw_product.save_to_json(file, compact=True), items)
+        print(f"Schema:         {schema:10.1f} files/s")
+        print(f"Fast pretty:    {pretty:10.1f} files/s ({pretty / schema:.1f}x)")
+        print(f"Fast compact:   {compact:10.1f} files/s ({compact / schema:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measures the unit normalisation of parsed offers in offers per second.
+
+Compares astropy Quantities against the Measurements from the unit table.
+
+Usage:
+    python -m benchmarks.normalization_benchmark
+"""
+
+import copy
+import itertools
+import time
+from typing import Callable
+
+from loguru import logger
+
+from benchmarks.parser_benchmark import mapped_specifications
+from config import RAW_SPECIFICATIONS_DIR
+from config import ROOT_DIR
+from spec_extraction import extraction_config
+from spec_extraction.extraction import Parser
+from spec_extraction.field_mappings import FieldMappings
+from spec_extraction.normalization import measure_product_specifications
+from spec_extraction.normalization import normalize_product_specifications
+from spec_extraction.process import iter_raw_product_files
+
+OFFERS = 5000
+
+
+def measure(normalize: Callable[[dict], dict], specifications: list[dict]) -> float:
+    """Returns the offers per second."""
+    specifications = copy.deepcopy(specifications)  # normalisation replaces the values in place
+    start = time.perf_counter()
+    for specification in specifications:
+        normalize(specification)
+    return len(specifications) / (time.perf_counter() - start)
+
+
+def main():
+    logger.remove()  # measure normalisation, not logging
+    field_mappings = FieldMappings(ROOT_DIR / "spec_extraction" / "preparation" / "field_mappings.json")
+    field_mappings.load_from_disk()
+    raw_products = itertools.islice(iter_raw_product_files(RAW_SPECIFICATIONS_DIR), OFFERS)
+    parser = Parser(extraction_config.monitor_spec)
+    specifications = [parser.parse(spec) for spec in mapped_specifications(list(raw_products), field_mappings)]
+    print(f"Normalising {len(specifications)} offers")
+
+    quantities = measure(normalize_product_specifications, specifications)
+    measurements = measure(measure_product_specifications, specifications)
+    print(f"  Astropy quantities: {quantities:10.1f} offers/s")
+    print(f"  Unit table:         {measurements:10.1f} offers/s ({measurements / quantities:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Measures the throughput of the regex parser over the raw specification corpus in offers per second.
+
+Compares matching the raw patterns on every call against the patterns compiled at setup.
+
+Usage:
+    python -m benchmarks.parser_benchmark
+"""
+import copy
+import re
+import time
+from typing import List
+
+from loguru import logger
+
+from config import RAW_SPECIFICATIONS_DIR
+from config import ROOT_DIR
+from spec_extraction import exceptions
+from spec_extraction import extraction_config
+from spec_extraction.extraction import Parser
+from spec_extraction.field_mappings import FieldMappings
+from spec_extraction.model import RawProduct
+from spec_extraction.process import iter_raw_product_files
+
+ROUNDS = 3
+
+
+def create_pattern_structure_uncompiled(text: str, pattern, map_to: List[str] = None):
+    """Previous behaviour, searches the pattern string and slices the text for list mappings."""
+
+    def findall(pattern_: str, text_: str, mapping) -> List:
+        regex_matches = []
+        while True:
+            match_res = re.search(pattern_, text_)
+            if not match_res:
+                break
+            regex_matches.append({key: match_res.group(mapping.index(key) + 1) for key in mapping})
+            text_ = text_[match_res.end() :]
+        return regex_matches
+
+    extracted = re.search(pattern, text)
+    if not map_to:
+        try:
+            return extracted.group()
+        except AttributeError:
+            logger.error("No match found for pattern: %s", pattern)
+    if extracted:
+        if isinstance(map_to[0], list):
+            return findall(pattern, text, map_to[0])
+        return {map_to[idx]: value for idx, value in enumerate(extracted.groups())}
+    raise exceptions.TextExtractionError(f"Could not extract data from '{text}' with pattern '{pattern}'")
+
+
+def mapped_specifications(raw_products: list[RawProduct], field_mappings: FieldMappings) -> list[dict]:
+    """Maps the merchant keys to catalog keys like Processing.extract_with_regex."""
+    specifications = []
+    for raw_product in raw_products:
+        mappings = field_mappings.get_mappings_per_shop(raw_product.shop_name)
+        specifications.append(
+            {
+                catalog_key: raw_product.raw_specifications[merchant_key]
+                for catalog_key, merchant_key in mappings.items()
+                if merchant_key in raw_product.raw_specifications
+            }
+        )
+    return specifications
+
+
+def pattern_specifications(parser: Parser, specifications: list[dict]) -> list[dict]:
+    """Keeps the values of features with a pattern, the part of the parser affected by compiling."""
+    return [{key: value for key, value in spec.items() if parser.parser[key].pattern} for spec in specifications]
+
+
+def measure(parser: Parser, specifications: list[dict]) -> float:
+    """Returns the offers per second."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for specification in specifications:
+            parser.parse(specification)
+    return ROUNDS * len(specifications) / (time.perf_counter() - start)
+
+
+def main():
+    logger.remove()  # measure parsing, not logging
+    field_mappings = FieldMappings(ROOT_DIR / "spec_extraction" / "preparation" / "field_mappings.json")
+    field_mappings.load_from_disk()
+    specifications = mapped_specifications(list(iter_raw_product_files(RAW_SPECIFICATIONS_DIR)), field_mappings)
+    print(f"Parsing {len(specifications)} offers, {sum(map(len, specifications))} values")
+
+    compiled_parser = Parser(extraction_config.monitor_spec)
+    uncompiled_parser = Parser(copy.deepcopy(extraction_config.monitor_spec))  # features are shared otherwise
+    for feature in uncompiled_parser.parser.values():
+        if feature.formatter is extraction_config.create_pattern_structure:
+            feature.formatter = create_pattern_structure_uncompiled
+        feature.extractor = None
+
+    for label, offers in [
+        ("Pattern features", pattern_specifications(compiled_parser, specifications)),
+        ("All features", specifications),
+    ]:
+        uncompiled = measure(uncompiled_parser, offers)
+        compiled = measure(compiled_parser, offers)
+        print(label)
+        print(f"  Pattern strings:   {uncompiled:10.1f} offers/s")
+        print(f"  Compiled patterns: {compiled:10.1f} offers/s ({compiled / uncompiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
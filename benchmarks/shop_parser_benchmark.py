@@ -0,0 +1,58 @@
+"""Measures the throughput of the shop parsers in pages per second.
+
+Compares compiling a new scraper for every page against the compiled-scraper cache.
+
+Usage:
+    python -m benchmarks.shop_parser_benchmark
+"""
+import time
+
+from minet import Scraper
+
+from config import TEST_DIR
+from spec_extraction.html_parser import shop_parser
+
+TEST_DATA_DIR = TEST_DIR / "unit" / "spec_extraction" / "html_parser" / "test_data"
+TEST_PAGES = {
+    "mylemon.at": "mylemon_product_offer.html",
+    "ElectronicShop24": "electronicshop24_product_offer.html",
+    "Proshop.at": "proshop_product_offer.html",
+    "galaxus.at": "galaxus_product_offer.html",
+    "e-tec.at": "etec_product_offer.html",
+    "Amazon.at": "amazon_product_offer.html",
+    "Alternate.at": "alternate_product_offer.html",
+    "HiQ24": "hiq24_product_offer.html",
+}
+ROUNDS = 20
+
+
+def extract_uncached(raw_html: str, shop_name: str) -> dict[str, str]:
+    """Previous behaviour, compiles the scraper for each page."""
+    scraper = Scraper(shop_parser._get_parser_config(shop_name))
+    return {item["title"].rstrip(":"): item["description"] for item in scraper(raw_html)}
+
+
+def measure(extract_func, pages: list[tuple[str, str]]) -> float:
+    """Returns the pages per second."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for shop_name, raw_html in pages:
+            extract_func(raw_html, shop_name)
+    return ROUNDS * len(pages) / (time.perf_counter() - start)
+
+
+def main():
+    pages = [(shop_name, (TEST_DATA_DIR / filename).read_text()) for shop_name, filename in TEST_PAGES.items()]
+    for shop_name, raw_html in pages:
+        assert extract_uncached(raw_html, shop_name) == shop_parser.extract_tabular_data(raw_html, shop_name)
+
+    uncached = measure(extract_uncached, pages)
+    shop_parser.clear_scraper_cache()
+    cached = measure(shop_parser.extract_tabular_data, pages)
+
+    print(f"Scraper per page: {uncached:8.1f} pages/s")
+    print(f"Cached scraper:   {cached:8.1f} pages/s ({cached / uncached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,3 +13,4 @@ DATA_DIR = ROOT_DATA_DIR / DATASET_NAME
 PRODUCT_CATALOG_DIR = ROOT_DATA_DIR / f"{DATASET_NAME}_product_catalog"
 REFERENCE_DIR = ROOT_DATA_DIR / f"{DATASET_NAME}_reference_catalog"
 RAW_SPECIFICATIONS_DIR = ROOT_DATA_DIR / f"{DATASET_NAME}_raw_specs"
+RAW_SPECIFICATIONS_STORE = ROOT_DATA_DIR / f"{DATASET_NAME}_raw_specs.sqlite"
@@ -1,15 +1,17 @@
 import re
+from typing import TYPE_CHECKING
 from typing import Protocol
 from urllib.parse import urljoin
 
-import playwright.sync_api
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from .geizhals_model import CategoryPage
 from .geizhals_model import ProductPage
 
+if TYPE_CHECKING:
+    import playwright.sync_api
+
 
 class SupportsGoto(Protocol):
     def goto(self, url: str, post_load_hooks=None) -> str:
@@ -45,6 +47,8 @@ def get_base_domain(url: str) -> str:
 
 
 def parse_category_page(html: str, url: str) -> dict:
+    from bs4 import BeautifulSoup
+
     base_domain = get_base_domain(url)
     soup = BeautifulSoup(html, "html.parser")
     body = soup.find("body")
@@ -66,6 +70,8 @@ def parse_category_page(html: str, url: str) -> dict:
 
 
 def parse_product_page(html, product_url) -> dict:
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
     body = soup.find("body")
 
@@ -93,7 +99,7 @@ def parse_product_page(html, product_url) -> dict:
     return {"url": product_url, "product_name": product_name, "product_details": product_details, "offers": offers}
 
 
-def _dismiss_cookie_banner(page: playwright.sync_api.Page):
+def _dismiss_cookie_banner(page: "playwright.sync_api.Page"):
     """Dismisses the cookie banner on a Geizhals page.
 
     Automatically clicks on the "Accept" button.
@@ -105,7 +111,7 @@ def _dismiss_cookie_banner(page: playwright.sync_api.Page):
         page.wait_for_timeout(1000)
 
 
-def _select_products_per_page(page: playwright.sync_api.Page):
+def _select_products_per_page(page: "playwright.sync_api.Page"):
     """Selects max. products per page on a Geizhals category page.
 
     Automatically selects the highest option in the select field with ID "bl1_id".